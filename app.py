@@ -1,21 +1,37 @@
-from flask import Flask, render_template, request, send_file, jsonify
-import pandas as pd  # still used for fallback Excel generation if needed
+from flask import Flask, make_response, render_template, request, send_file
+from markupsafe import escape
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import gzip
+import hashlib
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import pytz
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font, Alignment
-from openpyxl.styles.borders import Border, Side
 from timezonefinder import TimezoneFinder
 import re
+import calendar
+import stat
+import tempfile
+import threading
+import time
+import zipfile
+from xml.sax.saxutils import escape as xml_escape
 
 app = Flask(__name__)
 
-# Instantiate a timezone finder object once to avoid repeated initialization.
-tz_finder = TimezoneFinder()
+# A single timezone finder shared by all requests.  It is created lazily on the
+# first lookup (loading its polygon data is the expensive part) and guarded by
+# a lock so concurrent worker threads never build more than one instance.
+# See get_timezone_finder().
+tz_finder = None
+tz_finder_lock = threading.Lock()
 
 # Caches for station metadata and available bulletin stations. These will be populated
 # on demand to avoid repeated network requests. See load_station_metadata() and
@@ -86,7 +102,6 @@ DEFAULT_STATIONS = {
     "51003": {"name": "Buoy 51003", "lat": 23.69, "lon": -162.25},
     "51004": {"name": "Buoy 51004", "lat": 25.84, "lon": -162.09},
 }
-BULLET_STATIONS = None  # Set of station_ids that currently have a .bull file available
 
 # ===== NOAA Station List URL =====
 # This URL points to the bulls.readme file, which lists the available buoy stations
@@ -96,22 +111,312 @@ STATION_LIST_URL = "https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/wave
 # The pattern for locating GFS wave data. The date (YYYYMMDD) and run hour (HH) will be inserted.
 NOAA_BASE = "https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod"
 
+# ===== HTTP Session =====
+# All NOAA/NDBC traffic goes through one session so TCP/TLS connections are kept
+# alive and reused across the run probes, the bulletin download and the metadata
+# requests instead of opening a fresh connection for every call.  Responses are
+# gzip-compressed on the wire (requests sends ``Accept-Encoding: gzip`` and
+# decodes transparently), and connection errors and transient 5xx responses are
+# retried on the pooled connection with exponential backoff.  A 404 is final and
+# returns immediately.
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=["HEAD", "GET"],
+    raise_on_status=False,
+)
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update({"User-Agent": "wave-app/1.0"})
+# pool_maxsize leaves room for the concurrent run probes (eight at once) plus the
+# requests of other worker threads; connections beyond it would be discarded
+# after use instead of being kept alive.
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=HTTP_RETRY))
+
+
+def url_exists(url: str, timeout: float | tuple[float, float] = 10) -> bool:
+    """
+    Return True if ``url`` responds with HTTP 200, without downloading the body.
+    """
+    resp = HTTP_SESSION.head(url, timeout=timeout, allow_redirects=True)
+    if resp.status_code in (403, 405):
+        # Some servers refuse HEAD; fall back to a streamed GET and drop the body.
+        resp = HTTP_SESSION.get(url, timeout=timeout, stream=True)
+        resp.close()
+    return resp.status_code == 200
+
+# ===== Request timeouts =====
+# All timeouts are (connect, read) pairs: an unreachable host fails within the
+# short connect budget, while a slow but live download still gets time to read.
+# NOMADS either answers a HEAD quickly or not at all, so probes are tight, and
+# the whole run discovery is capped by a wall-clock deadline so a slow or
+# unreachable server cannot tie up a worker for long.
+PROBE_TIMEOUT = (2, 5)  # seconds
+BULL_TIMEOUT = (3, 10)  # seconds
+LISTING_TIMEOUT = (3, 30)  # seconds
+DISCOVERY_DEADLINE = 8.0  # seconds
+
+# ===== Batch downloads =====
+# /download_batch builds one workbook per station; each mostly waits on its
+# bulletin download, so a few threads per request are enough.
+BATCH_MAX_STATIONS = 20
+BATCH_MAX_WORKERS = 4
+
+# ===== Cache lifetimes =====
+# GFS wave runs are published every 6 hours and a published bulletin never
+# changes, so the latest-run probe and downloaded bulletins are memoized for a
+# few minutes.  Parsed tables are keyed by run and kept for an hour, and the
+# station dropdown list is refreshed hourly.
+LATEST_RUN_TTL = 300  # seconds
+BULL_LINES_TTL = 600  # seconds
+PARSED_BULL_TTL = 3600  # seconds
+STATION_LIST_TTL = 3600  # seconds
+DOWNLOAD_MAX_AGE = 900  # seconds browsers may reuse a downloaded workbook
+# Downloaded bulletins and parsed tables are also written to disk so that every
+# worker process (and a restarted server) can reuse them; a bulletin never
+# changes once published, so these entries outlive a run's six-hour window
+# before being pruned.  The default directory is per user, and it is only used
+# while it is private to the server's user (see disk_cache_dir_ok()), since its
+# contents are rendered into pages as trusted output.
+DISK_CACHE_DIR = os.environ.get("WAVE_APP_CACHE_DIR") or os.path.join(
+    tempfile.gettempdir(), f"wave-app-cache-{os.getuid()}" if hasattr(os, "getuid") else "wave-app-cache"
+)
+DISK_CACHE_TTL = 6 * 3600  # seconds
+# The cache directory is also bounded in size: once this much has been written
+# since the last sweep, the oldest entries are evicted until it fits again.
+DISK_CACHE_MAX_BYTES = 100 * 1024 * 1024
+# Part of every disk cache key.  Bump it whenever a disk-cached function's
+# output changes shape or formatting, so entries written by an older deploy
+# are ignored instead of being unpacked into the new shape.
+DISK_CACHE_VERSION = 1
+
+
+def ttl_cache(seconds: float, maxsize: int = 128, cache_if=None):
+    """
+    Memoize a function's results for ``seconds``, keyed by its positional
+    arguments.
+
+    At most ``maxsize`` entries are kept (least recently used are evicted).  If
+    ``cache_if`` is given, a result is only stored when ``cache_if(result)`` is
+    true, so failures can be retried on the next call.  Exceptions are never
+    cached.  The wrapped function gains a ``cache_clear()`` method.
+    """
+    def decorator(func):
+        entries = OrderedDict()  # args -> (expires_at, value)
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(args)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(args)
+                    return entry[1]
+            value = func(*args)
+            if cache_if is None or cache_if(value):
+                with lock:
+                    entries[args] = (now + seconds, value)
+                    entries.move_to_end(args)
+                    while len(entries) > maxsize:
+                        entries.popitem(last=False)
+            return value
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+disk_cache_pruned_at = 0.0
+disk_cache_written = 0  # bytes this process has written since its last sweep
+disk_cache_prune_lock = threading.Lock()
+
+
+def disk_cache_dir_ok() -> bool:
+    """
+    Create ``DISK_CACHE_DIR`` (mode 0700) if needed and return True only if it
+    is a real directory owned by this process's user that no other user can
+    write to.  Otherwise the disk cache is bypassed entirely.
+    """
+    try:
+        os.makedirs(DISK_CACHE_DIR, mode=0o700, exist_ok=True)
+        st = os.lstat(DISK_CACHE_DIR)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode) or st.st_mode & 0o022:
+        return False
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+def prune_disk_cache(written: int = 0):
+    """
+    Sweep the disk cache: delete expired entries, then the oldest ones until
+    the directory holds at most ``DISK_CACHE_MAX_BYTES``.
+
+    ``written`` is the size of an entry just stored.  A sweep runs once per
+    ``DISK_CACHE_TTL``, or sooner once a tenth of the size limit has been
+    written since the last one, so the directory can only overshoot the limit
+    by that slack (per worker process).
+    """
+    global disk_cache_pruned_at, disk_cache_written
+    with disk_cache_prune_lock:
+        disk_cache_written += written
+        now = time.time()
+        if now - disk_cache_pruned_at < DISK_CACHE_TTL and disk_cache_written < DISK_CACHE_MAX_BYTES // 10:
+            return
+        disk_cache_pruned_at = now
+        disk_cache_written = 0
+        if not disk_cache_dir_ok():
+            return
+        kept = []  # (mtime, size, path) of unexpired entries
+        try:
+            with os.scandir(DISK_CACHE_DIR) as entries:
+                for entry in entries:
+                    try:
+                        stat = entry.stat()
+                        if now - stat.st_mtime > DISK_CACHE_TTL:
+                            os.remove(entry.path)
+                        else:
+                            kept.append((stat.st_mtime, stat.st_size, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            return
+        total = sum(size for _, size, _ in kept)
+        if total <= DISK_CACHE_MAX_BYTES:
+            return
+        kept.sort()
+        for _, size, path in kept:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= DISK_CACHE_MAX_BYTES:
+                break
+
+
+def disk_cache(seconds: float, cache_if=None):
+    """
+    Persist a function's results as JSON files under ``DISK_CACHE_DIR`` for
+    ``seconds``, keyed by ``DISK_CACHE_VERSION``, the function name and its
+    positional arguments.
+
+    The wrapped function must return a JSON-serializable tuple.  As with
+    ``ttl_cache``, ``cache_if`` decides which results are stored.  Every write
+    feeds ``prune_disk_cache``, which keeps the directory within
+    ``DISK_CACHE_MAX_BYTES``.  If the directory is not private to this user
+    (``disk_cache_dir_ok``), or on any disk error, the call simply falls
+    through to the function.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            key = hashlib.sha1(json.dumps([DISK_CACHE_VERSION, func.__name__, *args]).encode("utf-8")).hexdigest()
+            path = os.path.join(DISK_CACHE_DIR, f"{key}.json")
+            if not disk_cache_dir_ok():
+                return func(*args)
+            try:
+                if time.time() - os.path.getmtime(path) < seconds:
+                    with open(path, "r") as f:
+                        return tuple(json.load(f))
+            except (OSError, ValueError):
+                pass
+            value = func(*args)
+            if cache_if is None or cache_if(value):
+                try:
+                    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    with open(tmp_path, "w") as f:
+                        json.dump(value, f, separators=(",", ":"))
+                    os.replace(tmp_path, path)
+                    prune_disk_cache(os.path.getsize(path))
+                except (OSError, TypeError, ValueError):
+                    pass
+            return value
+        return wrapper
+    return decorator
+
+# ===== Bulletin header patterns =====
+# Compiled once at import time rather than on every parse.
+# LOCATION_RE matches the coordinate part of a header such as
+# "Location : 51201 (21.67N 158.12W)"; CYCLE_RE matches "YYYYMMDD HH".
+# TABLE_ROW_RE / DATA_LINE_RE pick out the data lines of the newer ("| day hour |")
+# and older ("Hr ...") layouts so header and footer lines are never tokenized.
+LOCATION_RE = re.compile(r"\(\s*([-+]?\d+(?:\.\d+)?)\s*([NS])\s+([-+]?\d+(?:\.\d+)?)\s*([EW])\)")
+CYCLE_RE = re.compile(r"(\d{8})\s*(\d{2})")
+TABLE_ROW_RE = re.compile(r"\s*\|\s*\d")
+DATA_LINE_RE = re.compile(r"\s*[-+.\d]")
+# BULL_HREF_RE pulls the station ID out of directory-listing links such as
+# <a href="gfswave.51201.bull">.
+BULL_HREF_RE = re.compile(r"""href\s*=\s*["']gfswave\.([^."'/]+)[^"']*\.bull["']""", re.IGNORECASE)
+# The "Cycle" and "Location" header lines are always within the first few
+# lines of a bulletin; header scans stop here.
+HEADER_SCAN_LINES = 50
+
+# ===== Display names =====
+# English day/month names used to format table timestamps without strftime.
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTH_NAMES = [
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+]
+
+# ===== Units =====
+M_TO_FT = 3.28084
+
+# ===== Display formats =====
+# "%-d" (no zero padding) is a glibc extension; the portable fallback pads and
+# strips the leading zero instead.
+MODEL_RUN_FORMAT = "%A, %B %-d, %Y %I:%M %p"
+MODEL_RUN_FORMAT_PORTABLE = "%A, %B %d, %Y %I:%M %p"
+
 # ===== Timezones =====
 # The app displays times in UTC and Hawaii Standard Time (HST). HST is used instead of the local timezone because many users
 # of buoy data in Hawaii prefer local time display. The user’s timezone is configured via pytz.
 HST = pytz.timezone("Pacific/Honolulu")
 UTC = pytz.utc
 
+
+@lru_cache(maxsize=64)
+def get_timezone(tz_name: str):
+    """
+    Return the pytz timezone for ``tz_name``, memoized across requests.
+
+    Raises ``pytz.UnknownTimeZoneError`` for invalid names (never cached).
+    """
+    return pytz.timezone(tz_name)
+
+
+def known_tz_name(tz_name: str | None) -> str | None:
+    """
+    Return the canonical name of timezone ``tz_name``, or ``None`` if it is
+    empty or unknown.
+
+    Request parameters go through this before they are used as cache keys, so
+    unknown zones all share the entry of the station's own zone.
+    """
+    if not tz_name:
+        return None
+    try:
+        return get_timezone(tz_name).zone
+    except Exception:
+        return None
+
 # Cache for compiled station metadata used by the interactive map.  This list is
 # computed once on demand and reused for subsequent requests.  Each element
 # contains the station ID, name, latitude and longitude.
 stations_data_cache = None
 
 
+@ttl_cache(STATION_LIST_TTL, maxsize=1)
 def get_station_list() -> list[tuple[str, str]]:
     """
     Build a list of available stations for the dropdown using the static
-    ``station_list.json`` file.
+    ``station_list.json`` file.  Cached for ``STATION_LIST_TTL`` seconds.
     """
     stations: list[tuple[str, str]] = []
     try:
@@ -177,13 +482,61 @@ def get_stations_data():
     stations_data_cache = data_list
     return stations_data_cache
 
+# Responses larger than this are gzip-compressed when the client accepts it.
+# The station list and the rendered table are highly repetitive text, so even
+# the fastest compression level shrinks them several-fold.
+GZIP_MIN_SIZE = 1024
+GZIP_MIMETYPES = {"text/html", "application/json"}
+
+
+@app.after_request
+def gzip_response(response):
+    """
+    Gzip-encode textual responses for clients that send ``Accept-Encoding: gzip``.
+    """
+    if (
+        response.direct_passthrough
+        or response.status_code != 200
+        or response.mimetype not in GZIP_MIMETYPES
+        or "Content-Encoding" in response.headers
+        or "gzip" not in request.headers.get("Accept-Encoding", "").lower()
+    ):
+        return response
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=1))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+@ttl_cache(STATION_LIST_TTL, maxsize=1)
+def get_stations_payload() -> tuple[bytes, bytes]:
+    """
+    Serialize the station metadata for the map once, returning the JSON body
+    both plain and gzip-compressed.
+    """
+    body = json.dumps(get_stations_data(), separators=(",", ":")).encode("utf-8")
+    return body, gzip.compress(body)
+
+
 @app.route('/stations.json')
 def stations_json():
     """
     JSON endpoint returning the list of station metadata dictionaries used by
-    the front‑end map.
+    the front‑end map.  The payload is pre-serialized (and pre-compressed) and
+    may be cached by the browser for ``STATION_LIST_TTL`` seconds.
     """
-    return jsonify(get_stations_data())
+    body, gzipped_body = get_stations_payload()
+    if "gzip" in request.headers.get("Accept-Encoding", "").lower():
+        response = app.response_class(gzipped_body, mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = app.response_class(body, mimetype="application/json")
+    response.vary.add("Accept-Encoding")
+    response.headers["Cache-Control"] = f"public, max-age={STATION_LIST_TTL}"
+    return response
 
 
 def load_station_metadata():
@@ -197,7 +550,7 @@ def load_station_metadata():
     station_url = "https://www.ndbc.noaa.gov/data/stations/station_table.txt"
     meta = {}
     try:
-        res = requests.get(station_url, timeout=30)
+        res = HTTP_SESSION.get(station_url, timeout=LISTING_TIMEOUT)
         res.raise_for_status()
         for line in res.text.splitlines():
             if not line or line.startswith('#'):
@@ -225,87 +578,315 @@ def load_station_metadata():
         STATION_META = meta
         return STATION_META
     except Exception:
-        STATION_META = DEFAULT_STATIONS.copy()
-        return STATION_META
+        # Retries already happened at the transport level.  Serve the fallback
+        # without caching it so a later call can still load the real table.
+        return DEFAULT_STATIONS.copy()
 
 
 def get_bullet_station_ids():
     """
     Retrieve the set of station IDs for which a GFS wave bulletin is currently available.
     """
-    global BULLET_STATIONS
-    if BULLET_STATIONS is not None:
-        return BULLET_STATIONS
     date_str, run_str = get_latest_run()
     if not date_str:
-        BULLET_STATIONS = set()
-        return BULLET_STATIONS
+        return set()
+    return list_bullet_station_ids(date_str, run_str)
+
+
+@ttl_cache(PARSED_BULL_TTL, maxsize=2, cache_if=bool)
+def list_bullet_station_ids(date_str: str, run_str: str) -> set[str]:
+    """
+    List the station IDs in the bulletin directory of one model run.
+
+    Keyed by run, so a newly published run is listed afresh instead of the
+    first run seen by the process being served forever.  Failures (an empty
+    set) are not cached.
+    """
     url = f"{NOAA_BASE}/gfs.{date_str}/{run_str}/wave/station/bulls.t{run_str}z/"
     ids = set()
     try:
-        res = requests.get(url, timeout=30)
+        res = HTTP_SESSION.get(url, timeout=LISTING_TIMEOUT)
         res.raise_for_status()
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(res.text, "html.parser")
-        for link in soup.find_all('a'):
-            href = link.get('href', '')
-            if href.startswith('gfswave.') and href.endswith('.bull'):
-                parts = href.split('.')
-                if len(parts) >= 2:
-                    sid = parts[1]
-                    ids.add(sid)
-        BULLET_STATIONS = ids
-        return BULLET_STATIONS
+        ids.update(BULL_HREF_RE.findall(res.text))
+        return ids
     except Exception:
-        BULLET_STATIONS = set()
-        return BULLET_STATIONS
+        return set()
 
 
+@ttl_cache(LATEST_RUN_TTL, maxsize=1, cache_if=lambda run: run[0] is not None)
 def get_latest_run():
     """
-    Determine the most recent available GFS model run.
+    Determine the most recent available GFS model run as ``(YYYYMMDD, HH)``.
+
+    Candidates are the eight most recent cycles that have already started by
+    the wall clock (cycles later today cannot exist yet).  The two newest are
+    probed first, which is where the latest published run almost always is;
+    the older ones are only probed if neither exists.  Within each wave the
+    probes run concurrently and the newest run that exists wins.  The result
+    is cached for ``LATEST_RUN_TTL`` seconds; a failed probe is not cached so
+    the next request tries again.
     """
     now = datetime.utcnow()
-    run_hours = [18, 12, 6, 0]
-    for delta_day in [0, 1]:
-        check_date = now - timedelta(days=delta_day)
-        yyyymmdd = check_date.strftime("%Y%m%d")
-        for hour in run_hours:
-            run_str = f"{hour:02d}"
-            url = f"{NOAA_BASE}/gfs.{yyyymmdd}/{run_str}/wave/station/bulls.t{run_str}z/"
-            test_file = f"{url}gfswave.51201.bull"
+    cycle_dt = now.replace(hour=now.hour - now.hour % 6, minute=0, second=0, microsecond=0)
+    candidates = []
+    for _ in range(8):
+        yyyymmdd = cycle_dt.strftime("%Y%m%d")
+        run_str = f"{cycle_dt.hour:02d}"
+        url = f"{NOAA_BASE}/gfs.{yyyymmdd}/{run_str}/wave/station/bulls.t{run_str}z/"
+        candidates.append((yyyymmdd, run_str, f"{url}gfswave.51201.bull"))
+        cycle_dt -= timedelta(hours=6)
+    deadline = time.monotonic() + DISCOVERY_DEADLINE
+    pool = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        for wave in (candidates[:2], candidates[2:]):
+            futures = [pool.submit(url_exists, test_file, PROBE_TIMEOUT) for _, _, test_file in wave]
+            # Walk results newest-first so an older run never wins over a newer one.
+            for (yyyymmdd, run_str, _), future in zip(wave, futures):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None, None
+                try:
+                    if future.result(timeout=remaining):
+                        return yyyymmdd, run_str
+                except Exception:
+                    continue
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return None, None
+
+
+@ttl_cache(BULL_LINES_TTL, maxsize=256)
+@disk_cache(DISK_CACHE_TTL, cache_if=bool)
+def fetch_bull_lines(bull_url: str) -> tuple[str, ...]:
+    """
+    Download a .bull file and return its lines.
+
+    The body is streamed and split into lines as it arrives, so the full text
+    is never held as a second string.  Raises ``requests.HTTPError`` if the
+    file is not available.  Only successful downloads are cached: in memory
+    for ``BULL_LINES_TTL`` seconds and on disk for ``DISK_CACHE_TTL`` (the URL
+    names a single run, whose bulletin never changes).
+    """
+    with HTTP_SESSION.get(bull_url, timeout=BULL_TIMEOUT, stream=True) as resp:
+        if resp.status_code != 200:
+            raise requests.HTTPError(f"HTTP {resp.status_code}", response=resp)
+        if resp.encoding is None:
+            resp.encoding = "utf-8"
+        return tuple(resp.iter_lines(chunk_size=65536, decode_unicode=True))
+
+
+def get_timezone_finder() -> TimezoneFinder:
+    """
+    Return the shared ``TimezoneFinder`` instance, creating it on first use.
+    """
+    global tz_finder
+    if tz_finder is None:
+        with tz_finder_lock:
+            if tz_finder is None:
+                tz_finder = TimezoneFinder()
+    return tz_finder
+
+
+def latlon_from_location(location_str: str | None) -> tuple[float | None, float | None]:
+    """
+    Return signed ``(lat, lon)`` from a .bull "Location" header, or
+    ``(None, None)`` if it carries no coordinates.
+    """
+    m = LOCATION_RE.search(location_str) if location_str else None
+    if not m:
+        return None, None
+    try:
+        lat = float(m.group(1))
+        lon = float(m.group(3))
+    except ValueError:
+        return None, None
+    return (lat if m.group(2).upper() == 'N' else -lat), (lon if m.group(4).upper() == 'E' else -lon)
+
+
+@lru_cache(maxsize=2048)
+def timezone_from_latlon(lat: float, lon: float) -> str | None:
+    """
+    Look up the IANA timezone name for a coordinate, or ``None`` if unknown.
+
+    Buoys do not move, so each station's point-in-polygon search is done once
+    per process.
+    """
+    try:
+        return get_timezone_finder().timezone_at(lat=lat, lng=lon)
+    except Exception:
+        return None
+
+
+def format_local_times(utc_times: list[datetime], tz_name: str) -> list[tuple[str, str]]:
+    """
+    Format naive UTC datetimes as ``(date, time)`` display labels in ``tz_name``.
+
+    When the zone's UTC offset is the same at both ends of the forecast window
+    (no DST change in between), the whole column is shifted in one NumPy
+    operation instead of converting every timestamp separately.
+    """
+    if not utc_times:
+        return []
+    try:
+        local_tz = get_timezone(tz_name)
+    except Exception:
+        local_tz = UTC
+    first_offset = utc_times[0].replace(tzinfo=UTC).astimezone(local_tz).utcoffset()
+    last_offset = utc_times[-1].replace(tzinfo=UTC).astimezone(local_tz).utcoffset()
+    if first_offset == last_offset:
+        shift = np.timedelta64(int(first_offset.total_seconds()), 's')
+        local_times = (np.array(utc_times, dtype='datetime64[s]') + shift).tolist()
+    else:
+        local_times = [t.replace(tzinfo=UTC).astimezone(local_tz) for t in utc_times]
+    # Equivalent to strftime("%A, %B %-d, %Y") and strftime("%I:%M %p")
+    # without the leading zero, built from lookup tables; consecutive rows
+    # share a date, so each date label is formatted only once.
+    labels = []
+    date_labels = {}
+    for local_dt in local_times:
+        day_key = (local_dt.year, local_dt.month, local_dt.day)
+        date_str_local = date_labels.get(day_key)
+        if date_str_local is None:
+            date_str_local = (
+                f"{DAY_NAMES[local_dt.weekday()]}, {MONTH_NAMES[local_dt.month]} {local_dt.day}, {local_dt.year}"
+            )
+            date_labels[day_key] = date_str_local
+        hour = local_dt.hour
+        time_str_local = f"{hour % 12 or 12}:{local_dt.minute:02d} {'AM' if hour < 12 else 'PM'}"
+        labels.append((date_str_local, time_str_local))
+    return labels
+
+
+def assemble_rows(forecast_times: list[datetime], swell_block: list[list[float]], combined_vals: list[float], tz_name: str) -> list[list]:
+    """
+    Build table rows from the columns gathered by either .bull parser.
+
+    ``swell_block`` holds 18 raw values per forecast time (Hs in m, Tp in s and
+    the direction waves come from, for six swells), NaN where missing, and
+    ``combined_vals`` the combined Hs in m.  The unit conversions run once over
+    the whole block; rows are only zipped together at the end.
+    """
+    if not swell_block:
+        return []
+    # Hs to feet, direction from "coming from" to "going to", and blank any
+    # incomplete swell group.
+    block = np.array(swell_block, dtype=float).reshape(-1, 6, 3)
+    incomplete = np.isnan(block).any(axis=2)
+    block[:, :, 0] *= M_TO_FT
+    block[:, :, 2] = np.mod(np.trunc(block[:, :, 2]) + 180, 360)
+    block[incomplete] = np.nan
+    # Round for display in the same pass: Hs to 2 decimals, Tp to 1, and
+    # directions become ints.  Missing values become None.
+    block[:, :, 0] = np.round(block[:, :, 0], 2)
+    block[:, :, 1] = np.round(block[:, :, 1], 1)
+    flat = block.reshape(len(swell_block), 18)
+    values = flat.astype(object)
+    values[:, 2::3] = np.nan_to_num(flat[:, 2::3]).astype(int).astype(object)
+    values[np.isnan(flat)] = None
+    combined_ft = np.round(np.array(combined_vals, dtype=float) * M_TO_FT, 2)
+    rows = []
+    for (date_str_local, time_str_local), swells, comb in zip(
+        format_local_times(forecast_times, tz_name), values.tolist(), combined_ft.tolist()
+    ):
+        swells.insert(0, time_str_local)
+        swells.insert(0, date_str_local)
+        swells.append(None if comb != comb else comb)
+        rows.append(swells)
+    return rows
+
+
+def first_datetime_on_or_after(threshold_dt: datetime, day_val: int, hour_val: int) -> datetime | None:
+    """
+    Return the earliest ``datetime`` at or after ``threshold_dt`` that falls on
+    day-of-month ``day_val`` at ``hour_val``, or ``None`` if there is none.
+
+    Newer-format rows only carry the day and hour, so this resolves them to a
+    full date across month (and year) ends.  Months too short for ``day_val``
+    are skipped.
+    """
+    if not (1 <= day_val <= 31 and 0 <= hour_val <= 23):
+        return None
+    year, month = threshold_dt.year, threshold_dt.month
+    for _ in range(14):
+        if day_val <= calendar.monthrange(year, month)[1]:
+            candidate = datetime(year, month, day_val, hour_val)
+            if candidate >= threshold_dt:
+                return candidate
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return None
+
+
+def numeric_tokens(tokens: list[str]) -> list[float]:
+    """
+    Convert .bull tokens to floats, ignoring "*" flags and non-numeric tokens.
+    """
+    # One C-level join/replace/split instead of a per-token strip and filter;
+    # tokens that were only "*" disappear in the split.
+    cleaned = " ".join(tokens).replace('*', '').split()
+    try:
+        return list(map(float, cleaned))
+    except ValueError:
+        values = []
+        for tok in cleaned:
             try:
-                resp = requests.head(test_file, timeout=10)
-            except Exception:
+                values.append(float(tok))
+            except ValueError:
                 continue
-            if resp.status_code == 200:
-                return yyyymmdd, run_str
-    return None, None
+        return values
 
 
 def parse_bull(station_id: str, target_tz_name: str | None = None):
     """
-    Fetch and parse the .bull file for a given station.
+    Fetch and parse the .bull file for a given station from the latest run.
     Returns: (cycle_str, location_str, model_run_str, rows, tz_name, error)
     """
     date_str, run_str = get_latest_run()
     if not date_str:
         return None, None, None, None, 'UTC', "No recent run found."
+    return parse_bull_for_run(station_id, date_str, run_str, known_tz_name(target_tz_name))
+
 
+@ttl_cache(PARSED_BULL_TTL, maxsize=128, cache_if=lambda result: result[5] is None)
+@disk_cache(DISK_CACHE_TTL, cache_if=lambda result: result[5] is None)
+def parse_bull_for_run(station_id: str, date_str: str, run_str: str, target_tz_name: str | None = None):
+    """
+    Fetch and parse the .bull file for a given station and model run.
+
+    Successful results are cached per ``(station, run, timezone)``, in memory
+    and on disk (shared by all worker processes), so viewing a table and then
+    downloading it parses the bulletin only once.  Callers pass
+    ``target_tz_name`` through ``known_tz_name()`` first so arbitrary request
+    values never become cache keys.  The returned rows are shared between
+    requests and must be treated as read-only.
+    """
     bull_url = f"{NOAA_BASE}/gfs.{date_str}/{run_str}/wave/station/bulls.t{run_str}z/gfswave.{station_id}.bull"
     try:
-        resp = requests.get(bull_url, timeout=10)
+        lines = fetch_bull_lines(bull_url)
+    except requests.HTTPError:
+        return None, None, None, None, 'UTC', f"No .bull file found for {station_id}"
     except Exception as e:
         return None, None, None, None, 'UTC', f"Error retrieving .bull file: {e}"
-    if resp.status_code != 200:
-        return None, None, None, None, 'UTC', f"No .bull file found for {station_id}"
 
-    lines = resp.text.splitlines()
     if not lines:
         return None, None, None, None, 'UTC', "Downloaded .bull file is empty."
 
-    cycle_line = next((l for l in lines if l.lower().strip().startswith("cycle")), None)
-    location_line = next((l for l in lines if l.lower().strip().startswith("location")), None)
+    # One pass over the header: find the "Cycle" and "Location" lines and check
+    # the first ten lines for the newer "day &" table layout.  Both header
+    # lines sit at the top of the file, so the data rows are never scanned.
+    cycle_line = location_line = None
+    uses_day_hour_format = False
+    for idx, line in enumerate(lines[:HEADER_SCAN_LINES]):
+        if idx < 10 and not uses_day_hour_format and "day &" in line.lower():
+            uses_day_hour_format = True
+        head = line.lstrip()[:8].lower()
+        if cycle_line is None and head.startswith("cycle"):
+            cycle_line = line
+        elif location_line is None and head.startswith("location"):
+            location_line = line
+        if cycle_line is not None and location_line is not None and (uses_day_hour_format or idx >= 9):
+            break
     if not cycle_line and len(lines) > 0:
         cycle_line = lines[0]
     if not location_line and len(lines) > 1:
@@ -314,44 +895,22 @@ def parse_bull(station_id: str, target_tz_name: str | None = None):
     location_str = location_line.strip() if location_line else ""
 
     # Extract lat/lon from header if present
-    lat = lon = None
+    lat, lon = latlon_from_location(location_str)
     tz_name = 'UTC'
-    if location_str:
-        m = re.search(r"\(([-+]?\d+(?:\.\d+)?)\s*([NS])\s+([-+]?\d+(?:\.\d+)?)\s*([EW])\)", location_str)
-        if m:
-            try:
-                lat_val = float(m.group(1))
-                lat_dir = m.group(2)
-                lon_val = float(m.group(3))
-                lon_dir = m.group(4)
-                lat = lat_val if lat_dir.upper() == 'N' else -lat_val
-                lon = lon_val if lon_dir.upper() == 'E' else -lon_val
-            except Exception:
-                lat = lon = None
     if lat is not None and lon is not None:
-        try:
-            tz_name_candidate = tz_finder.timezone_at(lat=lat, lng=lon)
-            if tz_name_candidate:
-                tz_name = tz_name_candidate
-        except Exception:
-            tz_name = 'UTC'
+        tz_name = timezone_from_latlon(lat, lon) or 'UTC'
 
     effective_tz_name = tz_name
     if target_tz_name:
         try:
-            _ = pytz.timezone(target_tz_name)
+            get_timezone(target_tz_name)
             effective_tz_name = target_tz_name
         except Exception:
             pass
 
-    # Detect file format
-    uses_day_hour_format = any("day &" in line.lower() for line in lines[:10])
-
-    rows = []
-
     if uses_day_hour_format:
         # ----- Newer format parser: 'day & hour' -----
-        m = re.search(r"(\d{8})\s*(\d{2})", cycle_str)
+        m = CYCLE_RE.search(cycle_str)
         cycle_date_str = date_str
         cycle_hour_str = run_str
         if m:
@@ -363,37 +922,21 @@ def parse_bull(station_id: str, target_tz_name: str | None = None):
             cycle_dt_utc = datetime.strptime(f"{date_str} {run_str}", "%Y%m%d %H")
 
         try:
-            model_run_local = cycle_dt_utc.replace(tzinfo=UTC).astimezone(pytz.timezone(effective_tz_name))
+            model_run_local = cycle_dt_utc.replace(tzinfo=UTC).astimezone(get_timezone(effective_tz_name))
         except Exception:
             model_run_local = cycle_dt_utc
         try:
-            model_run_str = "Model Run: " + model_run_local.strftime("%A, %B %-d, %Y %I:%M %p")
+            model_run_str = "Model Run: " + model_run_local.strftime(MODEL_RUN_FORMAT)
         except Exception:
-            model_run_str = "Model Run: " + model_run_local.strftime("%A, %B %d, %Y %I:%M %p").lstrip('0')
-
-        # Helper: find earliest datetime >= threshold with requested (day_of_month, hour)
-        def _first_dt_on_or_after(threshold_dt: datetime, day_val: int, hour_val: int) -> datetime | None:
-            base_year = threshold_dt.year
-            base_month = threshold_dt.month
-            for offset in range(0, 14):
-                y = base_year + ((base_month - 1 + offset) // 12)
-                mth = ((base_month - 1 + offset) % 12) + 1
-                try:
-                    cand = datetime(y, mth, day_val, hour_val)
-                except ValueError:
-                    continue
-                if cand >= threshold_dt:
-                    return cand
-            return None
+            model_run_str = "Model Run: " + model_run_local.strftime(MODEL_RUN_FORMAT_PORTABLE).lstrip('0')
 
-        M_TO_FT = 3.28084
         prev_forecast_dt_utc: datetime | None = None
+        forecast_times: list[datetime] = []
+        swell_block: list[list[float]] = []
+        combined_vals: list[float] = []
 
-        for line in lines:
-            striped = line.strip()
-            if not striped.startswith("|"):
-                continue
-            if "Hst" in striped or "---" in striped:
+        for line in filter(TABLE_ROW_RE.match, lines):
+            if "Hst" in line or "---" in line:
                 continue
 
             parts = [p.strip() for p in line.split("|") if p.strip()]
@@ -417,65 +960,29 @@ def parse_bull(station_id: str, target_tz_name: str | None = None):
                 except ValueError:
                     combined_hs_m = None
 
-            swell_groups = []
-            for swell_field in parts[2:]:
-                if not swell_field:
-                    swell_groups.append((None, None, None))
-                    continue
-                raw_tokens = swell_field.split()
-                cleaned_tokens = []
-                for tok in raw_tokens:
-                    tok_clean = tok.replace('*', '')
-                    if tok_clean == '':
-                        continue
-                    cleaned_tokens.append(tok_clean)
-                if len(cleaned_tokens) < 3:
-                    swell_groups.append((None, None, None))
-                else:
-                    try:
-                        hs_val = float(cleaned_tokens[0])
-                        tp_val = float(cleaned_tokens[1])
-                        dir_raw = int(float(cleaned_tokens[2]))
-                        dir_val = (dir_raw + 180) % 360
-                        swell_groups.append((hs_val, tp_val, dir_val))
-                    except ValueError:
-                        swell_groups.append((None, None, None))
-
-            while len(swell_groups) < 6:
-                swell_groups.append((None, None, None))
-            if len(swell_groups) > 6:
-                swell_groups = swell_groups[:6]
+            # One pass per swell field: strip the "*" flags from the whole field
+            # and split once.  Raw values go into a flat float row (NaN when a
+            # group is missing) that is converted with the rest of the block.
+            swell_values = []
+            for swell_field in parts[2:8]:
+                tokens = swell_field.replace('*', '').split()
+                try:
+                    swell_values.extend((float(tokens[0]), float(tokens[1]), float(tokens[2])))
+                except (IndexError, ValueError):
+                    swell_values.extend((np.nan, np.nan, np.nan))
+            swell_values.extend([np.nan] * (18 - len(swell_values)))
 
             # Month-end continuity: never go backward in time
             threshold_dt = prev_forecast_dt_utc if (prev_forecast_dt_utc and prev_forecast_dt_utc > cycle_dt_utc) else cycle_dt_utc
-            forecast_dt_utc = _first_dt_on_or_after(threshold_dt, day_val, hour_val)
+            forecast_dt_utc = first_datetime_on_or_after(threshold_dt, day_val, hour_val)
             if forecast_dt_utc is None:
                 continue
             prev_forecast_dt_utc = forecast_dt_utc
+            forecast_times.append(forecast_dt_utc)
+            swell_block.append(swell_values)
+            combined_vals.append(np.nan if combined_hs_m is None else combined_hs_m)
 
-            try:
-                local_tz = pytz.timezone(effective_tz_name)
-            except Exception:
-                local_tz = UTC
-            local_dt = forecast_dt_utc.replace(tzinfo=UTC).astimezone(local_tz)
-            try:
-                date_str_local = local_dt.strftime("%A, %B %-d, %Y")
-            except Exception:
-                date_str_local = local_dt.strftime("%A, %B %d, %Y").lstrip('0')
-            time_str_local = local_dt.strftime("%I:%M %p").lstrip('0')
-
-            combined_hs_ft = None
-            if combined_hs_m is not None:
-                combined_hs_ft = combined_hs_m * M_TO_FT
-
-            row = [date_str_local, time_str_local]
-            for hs_m, tp_val, dir_val in swell_groups:
-                if hs_m is None:
-                    row.extend([None, None, None])
-                else:
-                    row.extend([hs_m * M_TO_FT, tp_val, dir_val])
-            row.append(combined_hs_ft)
-            rows.append(row)
+        rows = assemble_rows(forecast_times, swell_block, combined_vals, effective_tz_name)
 
     else:
         # ----- Older format parser: header contains "Hr" followed by swell data -----
@@ -487,7 +994,7 @@ def parse_bull(station_id: str, target_tz_name: str | None = None):
         if start_idx is None:
             return cycle_str, location_str, None, None, effective_tz_name, "Data section not found in .bull file."
 
-        m_old = re.search(r"(\d{8})\s*(\d{2})", cycle_str)
+        m_old = CYCLE_RE.search(cycle_str)
         cycle_date_str_old = date_str
         cycle_hour_str_old = run_str
         if m_old:
@@ -498,15 +1005,20 @@ def parse_bull(station_id: str, target_tz_name: str | None = None):
         except Exception:
             cycle_dt_utc_old = datetime.strptime(f"{date_str} {run_str}", "%Y%m%d %H")
         try:
-            model_run_local_old = cycle_dt_utc_old.replace(tzinfo=UTC).astimezone(pytz.timezone(effective_tz_name))
+            model_run_local_old = cycle_dt_utc_old.replace(tzinfo=UTC).astimezone(get_timezone(effective_tz_name))
         except Exception:
             model_run_local_old = cycle_dt_utc_old
         try:
-            model_run_str = "Model Run: " + model_run_local_old.strftime("%A, %B %-d, %Y %I:%M %p")
+            model_run_str = "Model Run: " + model_run_local_old.strftime(MODEL_RUN_FORMAT)
         except Exception:
-            model_run_str = "Model Run: " + model_run_local_old.strftime("%A, %B %d, %Y %I:%M %p").lstrip('0')
+            model_run_str = "Model Run: " + model_run_local_old.strftime(MODEL_RUN_FORMAT_PORTABLE).lstrip('0')
 
-        for line in lines[start_idx:]:
+        # Swell values start at token 6 of each data line.  Every line's numeric
+        # tokens are gathered first and converted together in assemble_rows().
+        hr_offsets = []
+        swell_block = []
+        combined_vals = []
+        for line in filter(DATA_LINE_RE.match, lines[start_idx:]):
             parts = line.split()
             if len(parts) < 20:
                 continue
@@ -514,85 +1026,20 @@ def parse_bull(station_id: str, target_tz_name: str | None = None):
                 hr_offset = float(parts[0])
             except ValueError:
                 continue
-            utc_dt = cycle_dt_utc_old + timedelta(hours=hr_offset)
-            try:
-                local_tz = pytz.timezone(effective_tz_name)
-            except Exception:
-                local_tz = UTC
-            local_dt = utc_dt.replace(tzinfo=UTC).astimezone(local_tz)
-            try:
-                date_str_local = local_dt.strftime("%A, %B %-d, %Y")
-            except Exception:
-                date_str_local = local_dt.strftime("%A, %B %d, %Y").lstrip('0')
-            time_str_local = local_dt.strftime("%I:%M %p").lstrip('0')
-            row = [date_str_local, time_str_local]
-            idx_base = 6
-            for _swell in range(6):
-                hs_val = tp_val = dir_val = None
-                tokens_collected = 0
-                while tokens_collected < 3 and idx_base < len(parts):
-                    tok = parts[idx_base]
-                    idx_base += 1
-                    tok_clean = tok.replace('*', '')
-                    if tok_clean == '':
-                        continue
-                    if tokens_collected == 0:
-                        try:
-                            hs_val = float(tok_clean) * 3.28084
-                            tokens_collected += 1
-                            continue
-                        except ValueError:
-                            continue
-                    if tokens_collected == 1:
-                        try:
-                            tp_val = float(tok_clean)
-                            tokens_collected += 1
-                            continue
-                        except ValueError:
-                            continue
-                    if tokens_collected == 2:
-                        try:
-                            dir_raw = int(float(tok_clean))
-                            dir_val = (dir_raw + 180) % 360
-                            tokens_collected += 1
-                            continue
-                        except ValueError:
-                            continue
-                if tokens_collected < 3:
-                    row.extend([None, None, None])
-                else:
-                    row.extend([hs_val, tp_val, dir_val])
-            combined_hs_ft = None
-            for tok in reversed(parts):
-                tok_clean = tok.replace('*', '')
-                if tok_clean == '':
-                    continue
-                try:
-                    combined_hs_ft = float(tok_clean) * 3.28084
-                    break
-                except ValueError:
-                    continue
-            row.append(combined_hs_ft)
-            rows.append(row)
-
-    # Round numeric values: Hs and Combined to 2 decimals, Tp to 1 decimal, Direction to int
-    for i, r in enumerate(rows):
-        idx_num = 2
-        for _g in range(6):
-            if r[idx_num] is not None:
-                r[idx_num] = round(r[idx_num], 2)
-            idx_num += 1
-            if r[idx_num] is not None:
-                r[idx_num] = round(r[idx_num], 1)
-            idx_num += 1
-            if r[idx_num] is not None:
-                try:
-                    r[idx_num] = int(round(r[idx_num]))
-                except Exception:
-                    pass
-            idx_num += 1
-        if r[-1] is not None:
-            r[-1] = round(r[-1], 2)
+            hr_offsets.append(hr_offset)
+            values = numeric_tokens(parts[6:])
+            if values:
+                combined_vals.append(values[-1])
+            else:
+                head_values = numeric_tokens(parts[:6])
+                combined_vals.append(head_values[-1] if head_values else np.nan)
+            swell_block.append((values + [np.nan] * 18)[:18])
+
+        # Forecast hours -> UTC timestamps in one step (microsecond resolution,
+        # matching timedelta(hours=...)).
+        hr_micros = np.round(np.array(hr_offsets, dtype=float) * 3_600_000_000).astype('timedelta64[us]')
+        forecast_times = (np.datetime64(cycle_dt_utc_old, 'us') + hr_micros).tolist()
+        rows = assemble_rows(forecast_times, swell_block, combined_vals, effective_tz_name)
 
     if not rows:
         return cycle_str, location_str, None, None, effective_tz_name, "No data rows parsed from .bull file."
@@ -601,263 +1048,370 @@ def parse_bull(station_id: str, target_tz_name: str | None = None):
 # -----------------------------------------------------------------------------
 # Table Formatting and Export Helpers
 # -----------------------------------------------------------------------------
+# Fill colours shared by the HTML table and the Excel export (hex without '#',
+# as SpreadsheetML expects). Built once at import rather than on every render.
+SWELL_GROUP_COLORS = (
+    {"header": "C00000", "subheader": "F8B4B4", "data": "F9DCDC"},
+    {"header": "ED7D31", "subheader": "FBE5D6", "data": "FDE7D4"},
+    {"header": "FFC000", "subheader": "FFF2CC", "data": "FFF9E5"},
+    {"header": "00B050", "subheader": "D5E8D4", "data": "EAF3E8"},
+    {"header": "00B0F0", "subheader": "D9EAF6", "data": "ECF5FB"},
+    {"header": "92D050", "subheader": "E2F0D9", "data": "F2F8EE"},
+)
+COMBINED_COLORS = {"header": "7030A0", "subheader": "D9D2E9", "data": "EDE9F4"}
+EXCEL_PALETTE = tuple(color for colors in SWELL_GROUP_COLORS for color in colors.values()) + tuple(COMBINED_COLORS.values())
+HTML_GROUP_COLORS = tuple({k: f"#{v}" for k, v in colors.items()} for colors in SWELL_GROUP_COLORS)
+HTML_COMBINED_COLORS = {k: f"#{v}" for k, v in COMBINED_COLORS.items()}
+TABLE_TOTAL_COLS = 2 + len(SWELL_GROUP_COLORS) * 3 + 1  # Date, Time, 6 x (Hs, Tp, Dir), Combined Hs
+# Spreadsheet column names A, B, ..., Z, AA, AB, ... for every table column.
+EXCEL_COLUMN_LETTERS = tuple(
+    (chr(64 + idx // 26) if idx >= 26 else "") + chr(65 + idx % 26) for idx in range(TABLE_TOTAL_COLS)
+)
+# Row positions holding a wave height (stored in feet, shown in metres for Metric).
+HS_COLUMNS = frozenset([2 + g * 3 for g in range(len(SWELL_GROUP_COLORS))] + [TABLE_TOTAL_COLS - 1])
+
+# Daylight rows are bold with a solid border; night rows get a dashed border.
+BOLD_START = datetime.strptime("6:00:00 AM", "%I:%M:%S %p").time()
+BOLD_END = datetime.strptime("7:00:00 PM", "%I:%M:%S %p").time()
+DASHED_START_EVENING = datetime.strptime("8:00:00 PM", "%I:%M:%S %p").time()
+DASHED_END_MORNING = datetime.strptime("5:00:00 AM", "%I:%M:%S %p").time()
+
+
+@lru_cache(maxsize=128)
+def time_band(time_label: str) -> str | None:
+    """
+    Classify a displayed time label as ``"bold"`` (daylight), ``"dashed"``
+    (night) or ``None``.
+
+    Forecast rows only ever carry a handful of distinct labels, so the
+    strptime work is done once per label rather than once per row.
+    """
+    parsed_time = None
+    for fmt in ("%I:%M %p", "%I:%M:%S %p"):
+        try:
+            parsed_time = datetime.strptime(time_label, fmt).time()
+            break
+        except Exception:
+            continue
+    if parsed_time is None:
+        return None
+    if BOLD_START <= parsed_time <= BOLD_END:
+        return "bold"
+    if parsed_time >= DASHED_START_EVENING or parsed_time <= DASHED_END_MORNING:
+        return "dashed"
+    return None
+
+
+@lru_cache(maxsize=4)
+def html_column_header(unit: str) -> str:
+    """
+    Return the two static column-header rows of the HTML table for ``unit``.
+    """
+    hs_unit_label = '(ft)' if unit == 'US' else '(m)'
+    parts = ['<tr><th rowspan="2">Date</th><th rowspan="2">Time</th>']
+    for idx, col in enumerate(HTML_GROUP_COLORS, start=1):
+        parts.append(f'<th colspan="3" style="background-color:{col["header"]}; color:white; text-align:center;">Swell {idx}</th>')
+    parts.append(f'<th style="background-color:{HTML_COMBINED_COLORS["header"]}; color:white; text-align:center;">Combined</th>')
+    parts.append('</tr>\n<tr>')
+    for col in HTML_GROUP_COLORS:
+        parts.append(f'<th style="background-color:{col["subheader"]}; text-align:center;">Hs<br>{hs_unit_label}</th>')
+        parts.append(f'<th style="background-color:{col["subheader"]}; text-align:center;">Tp<br>(s)</th>')
+        parts.append(f'<th style="background-color:{col["subheader"]}; text-align:center;">Dir<br>(d)</th>')
+    parts.append(f'<th style="background-color:{HTML_COMBINED_COLORS["subheader"]}; text-align:center;">Hs<br>{hs_unit_label}</th>')
+    parts.append('</tr>\n')
+    return "".join(parts)
+
+def html_row_prefixes(band: str | None) -> tuple[str, str, tuple[str, ...], str]:
+    """
+    Return the opening ``<td>`` tags for a data row in time band ``band``:
+    ``(date, time, one per swell group, combined)``.
+    """
+    border_style = ""
+    font_weight_row = "normal"
+    if band == "bold":
+        border_style = "border:1px solid #000;"
+        font_weight_row = "bold"
+    elif band == "dashed":
+        border_style = "border:1px dashed #999;"
+    date_td = f'<td style="font-weight:bold; {border_style} padding:4px 8px;">'
+    time_td = f'<td style="font-weight:{font_weight_row}; {border_style} padding:4px 8px;">'
+    group_tds = tuple(
+        f'<td style="background-color:{col["data"]}; text-align:right; font-weight:{font_weight_row}; {border_style} padding:4px 8px;">'
+        for col in HTML_GROUP_COLORS
+    )
+    combined_td = (
+        f'<td style="background-color:{HTML_COMBINED_COLORS["data"]}; text-align:right; '
+        f'font-weight:{font_weight_row}; {border_style} padding:4px 8px;">'
+    )
+    return date_td, time_td, group_tds, combined_td
+
+
+# Cell styles only vary by time band and column, so every opening tag is built
+# once here rather than formatted again for each cell.
+HTML_ROW_PREFIXES = {band: html_row_prefixes(band) for band in (None, "bold", "dashed")}
+
+
 def build_html_table(cycle_str: str, location_str: str, model_run_str: str | None, rows: list[list], tz_label: str, unit: str) -> str:
     """
     Build an HTML table string mimicking the Excel "Table View" worksheet.
     """
-    group_colors = [
-        {"header": "#C00000", "subheader": "#F8B4B4", "data": "#F9DCDC"},
-        {"header": "#ED7D31", "subheader": "#FBE5D6", "data": "#FDE7D4"},
-        {"header": "#FFC000", "subheader": "#FFF2CC", "data": "#FFF9E5"},
-        {"header": "#00B050", "subheader": "#D5E8D4", "data": "#EAF3E8"},
-        {"header": "#00B0F0", "subheader": "#D9EAF6", "data": "#ECF5FB"},
-        {"header": "#92D050", "subheader": "#E2F0D9", "data": "#F2F8EE"},
+    total_cols = TABLE_TOTAL_COLS
+    metric = unit != 'US'
+    parts = [
+        '<table class="table table-bordered table-sm">\n',
+        f'<tr><td colspan="{total_cols}"><strong>{escape(cycle_str)}</strong></td></tr>\n',
+        f'<tr><td colspan="{total_cols}"><strong>{escape(location_str)}</strong></td></tr>\n',
+        # Model run is intentionally omitted in HTML
+        f'<tr><td colspan="{total_cols}"><strong>Time Zone: {escape(tz_label)}</strong></td></tr>\n',
+        html_column_header(unit),
     ]
-    combined_colors = {"header": "#7030A0", "subheader": "#D9D2E9", "data": "#EDE9F4"}
-    total_cols = 2 + len(group_colors) * 3 + 1
-    html = '<table class="table table-bordered table-sm">\n'
-    html += f'<tr><td colspan="{total_cols}"><strong>{cycle_str}</strong></td></tr>\n'
-    html += f'<tr><td colspan="{total_cols}"><strong>{location_str}</strong></td></tr>\n'
-    # Model run is intentionally omitted in HTML
-    html += f'<tr><td colspan="{total_cols}"><strong>Time Zone: {tz_label}</strong></td></tr>\n'
-    html += '<tr>'
-    html += '<th rowspan="2">Date</th>'
-    html += '<th rowspan="2">Time</th>'
-    for idx, col in enumerate(group_colors, start=1):
-        html += f'<th colspan="3" style="background-color:{col["header"]}; color:white; text-align:center;">Swell {idx}</th>'
-    html += f'<th style="background-color:{combined_colors["header"]}; color:white; text-align:center;">Combined</th>'
-    html += '</tr>\n'
-    html += '<tr>'
-    hs_unit_label = '(ft)' if unit == 'US' else '(m)'
-    for col in group_colors:
-        html += f'<th style="background-color:{col["subheader"]}; text-align:center;">Hs<br>{hs_unit_label}</th>'
-        html += f'<th style="background-color:{col["subheader"]}; text-align:center;">Tp<br>(s)</th>'
-        html += f'<th style="background-color:{col["subheader"]}; text-align:center;">Dir<br>(d)</th>'
-    html += f'<th style="background-color:{combined_colors["subheader"]}; text-align:center;">Hs<br>{hs_unit_label}</th>'
-    html += '</tr>\n'
+    append = parts.append
     for row in rows:
-        try:
-            parsed_time = datetime.strptime(row[1], "%I:%M %p").time()
-        except Exception:
-            try:
-                parsed_time = datetime.strptime(row[1], "%I:%M:%S %p").time()
-            except Exception:
-                parsed_time = None
-        bold_start = datetime.strptime("6:00:00 AM", "%I:%M:%S %p").time()
-        bold_end = datetime.strptime("7:00:00 PM", "%I:%M:%S %p").time()
-        dashed_start_evening = datetime.strptime("8:00:00 PM", "%I:%M:%S %p").time()
-        dashed_end_morning = datetime.strptime("5:00:00 AM", "%I:%M:%S %p").time()
-        border_style = ""
-        font_weight_row = "normal"
-        if parsed_time is not None:
-            if bold_start <= parsed_time <= bold_end:
-                border_style = "border:1px solid #000;"
-                font_weight_row = "bold"
-            elif parsed_time >= dashed_start_evening or parsed_time <= dashed_end_morning:
-                border_style = "border:1px dashed #999;"
-                font_weight_row = "normal"
-        html += '<tr>'
-        date_style = f'font-weight:bold; {border_style} padding:4px 8px;'
-        html += f'<td style="{date_style}">{row[0]}</td>'
-        time_style = f'font-weight:{font_weight_row}; {border_style} padding:4px 8px;'
-        html += f'<td style="{time_style}">{row[1]}</td>'
+        date_td, time_td, group_tds, combined_td = HTML_ROW_PREFIXES[time_band(row[1])]
+        append(f'<tr>{date_td}{escape(row[0])}</td>{time_td}{escape(row[1])}</td>')
         idx = 2
-        for col in group_colors:
+        for td in group_tds:
             val = row[idx]
             if val is None:
                 hs_str = ""
             else:
-                display_val = val if unit == 'US' else (val / 3.28084)
+                display_val = (val / M_TO_FT) if metric else val
                 hs_str = f"{display_val:.2f}"
-            cell_style = f'background-color:{col["data"]}; text-align:right; font-weight:{font_weight_row}; {border_style} padding:4px 8px;'
-            html += f'<td style="{cell_style}">{hs_str}</td>'
-            idx += 1
-            val = row[idx]
+            val = row[idx + 1]
             tp_str = "" if val is None else f"{val:.1f}"
-            html += f'<td style="{cell_style}">{tp_str}</td>'
-            idx += 1
-            val = row[idx]
-            dir_str = "" if val is None else f"{val}"
-            html += f'<td style="{cell_style}">{dir_str}</td>'
-            idx += 1
+            val = row[idx + 2]
+            dir_str = "" if val is None else f"{val:d}"
+            append(f'{td}{hs_str}</td>{td}{tp_str}</td>{td}{dir_str}</td>')
+            idx += 3
         val = row[-1]
         if val is None:
             comb_str = ""
         else:
-            display_comb = val if unit == 'US' else (val / 3.28084)
+            display_comb = (val / M_TO_FT) if metric else val
             comb_str = f"{display_comb:.2f}"
-        cell_style = f'background-color:{combined_colors["data"]}; text-align:right; font-weight:{font_weight_row}; {border_style} padding:4px 8px;'
-        html += f'<td style="{cell_style}">{comb_str}</td>'
-        html += '</tr>\n'
-    html += '</table>'
-    return html
-
-def build_excel_workbook(cycle_str: str, location_str: str, model_run_str: str | None, rows: list[list], tz_label: str, unit: str) -> BytesIO:
-    """
-    Create an Excel workbook that mirrors the formatting of the Excel "Table View".
-    """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Table View"
-    group_colors = [
-        {"header": "C00000", "subheader": "F8B4B4", "data": "F9DCDC"},
-        {"header": "ED7D31", "subheader": "FBE5D6", "data": "FDE7D4"},
-        {"header": "FFC000", "subheader": "FFF2CC", "data": "FFF9E5"},
-        {"header": "00B050", "subheader": "D5E8D4", "data": "EAF3E8"},
-        {"header": "00B0F0", "subheader": "D9EAF6", "data": "ECF5FB"},
-        {"header": "92D050", "subheader": "E2F0D9", "data": "F2F8EE"},
+        append(f'{combined_td}{comb_str}</td></tr>\n')
+    parts.append('</table>')
+    return "".join(parts)
+
+# ===== Direct XLSX writer =====
+# The download is a single fixed-layout sheet, so build_excel_bytes() writes the
+# SpreadsheetML parts itself instead of going through a general-purpose library.
+# Everything except the sheet body and the cell formats is static.
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Table View" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+# Font ids: 0 default, 1 bold, 2 bold white (group headers), 3 plain.
+XLSX_FONTS = (
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>',
+    '<font><b val="1"/></font>',
+    '<font><b val="1"/><color rgb="00FFFFFF"/></font>',
+    '<font/>',
+)
+# Fill ids 0 and 1 are reserved by the format; palette colours follow.
+XLSX_FILL_IDS = {color: idx for idx, color in enumerate(EXCEL_PALETTE, start=2)}
+XLSX_BORDER_IDS = {None: 0, "bold": 1, "dashed": 2}  # keyed by time_band()
+XLSX_NUMFMT_IDS = {None: 0, "0.00": 2, "0.0": 164}
+XLSX_COLS = "".join(
+    f'<col min="{col}" max="{col}" width="{width}" customWidth="1"/>'
+    for col, width in enumerate([30, 15] + [10] * (TABLE_TOTAL_COLS - 2), start=1)
+)
+
+
+def xlsx_styles_xml(cell_formats: list[tuple[int, int, int, int, bool]]) -> str:
+    """
+    Render styles.xml for ``cell_formats``, a list of
+    ``(font_id, fill_id, border_id, numfmt_id, centered)`` tuples whose
+    positions are the ``s`` indexes used in the sheet.
+    """
+    fills = ['<fill><patternFill/></fill>', '<fill><patternFill patternType="gray125"/></fill>']
+    fills += [
+        f'<fill><patternFill patternType="solid"><fgColor rgb="00{color}"/><bgColor rgb="00{color}"/></patternFill></fill>'
+        for color in EXCEL_PALETTE
     ]
-    combined_colors = {"header": "7030A0", "subheader": "D9D2E9", "data": "EDE9F4"}
-    total_cols = 2 + len(group_colors) * 3 + 1
-    row_idx = 1
-    ws.merge_cells(start_row=row_idx, start_column=1, end_row=row_idx, end_column=total_cols)
-    cell = ws.cell(row=row_idx, column=1, value=cycle_str)
-    cell.font = Font(bold=True)
-    row_idx += 1
-    ws.merge_cells(start_row=row_idx, start_column=1, end_row=row_idx, end_column=total_cols)
-    cell = ws.cell(row=row_idx, column=1, value=location_str)
-    cell.font = Font(bold=True)
-    row_idx += 1
-    # Omit model run row in Excel per your current requirements
-    ws.merge_cells(start_row=row_idx, start_column=1, end_row=row_idx, end_column=total_cols)
-    cell = ws.cell(row=row_idx, column=1, value=f"Time Zone: {tz_label}")
-    cell.font = Font(bold=True)
-    row_idx += 1
-    ws.cell(row=row_idx, column=1, value="Date").font = Font(bold=True)
-    ws.cell(row=row_idx, column=2, value="Time").font = Font(bold=True)
-    col_idx = 3
-    for idx, colors in enumerate(group_colors, start=1):
-        ws.merge_cells(start_row=row_idx, start_column=col_idx, end_row=row_idx, end_column=col_idx + 2)
-        hdr_cell = ws.cell(row=row_idx, column=col_idx, value=f"Swell {idx}")
-        hdr_cell.fill = PatternFill(start_color=colors["header"], end_color=colors["header"], fill_type="solid")
-        hdr_cell.font = Font(bold=True, color="FFFFFF")
-        hdr_cell.alignment = Alignment(horizontal="center")
-        col_idx += 3
-    comb_cell = ws.cell(row=row_idx, column=col_idx, value="Combined")
-    comb_cell.fill = PatternFill(start_color=combined_colors["header"], end_color=combined_colors["header"], fill_type="solid")
-    comb_cell.font = Font(bold=True, color="FFFFFF")
-    comb_cell.alignment = Alignment(horizontal="center")
-    row_idx += 1
-    col_idx = 3
+    borders = ['<border><left/><right/><top/><bottom/><diagonal/></border>']
+    for style_name in ("thin", "dashed"):
+        sides = "".join(
+            f'<{side} style="{style_name}"><color rgb="00000000"/></{side}>' for side in ("left", "right", "top", "bottom")
+        )
+        borders.append(f'<border>{sides}<diagonal/></border>')
+    xfs = []
+    for font_id, fill_id, border_id, numfmt_id, centered in cell_formats:
+        xf = f'<xf numFmtId="{numfmt_id}" fontId="{font_id}" fillId="{fill_id}" borderId="{border_id}" xfId="0"'
+        if centered:
+            xfs.append(xf + ' applyAlignment="1"><alignment horizontal="center"/></xf>')
+        else:
+            xfs.append(xf + '/>')
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<numFmts count="1"><numFmt numFmtId="164" formatCode="0.0"/></numFmts>'
+        f'<fonts count="{len(XLSX_FONTS)}">{"".join(XLSX_FONTS)}</fonts>'
+        f'<fills count="{len(fills)}">{"".join(fills)}</fills>'
+        f'<borders count="{len(borders)}">{"".join(borders)}</borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        f'<cellXfs count="{len(xfs)}">{"".join(xfs)}</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    )
+
+
+def build_excel_bytes(cycle_str: str, location_str: str, model_run_str: str | None, rows: list[list], tz_label: str, unit: str) -> BytesIO:
+    """
+    Write the "Table View" workbook straight to XLSX: values, fills, fonts,
+    borders, number formats, merges and column widths.  Each cell is a single
+    formatted string rather than an object, so this is far cheaper than
+    building the sheet with openpyxl (whose output it reproduces).
+    """
+    cell_formats = [(0, 0, 0, 0, False)]
+    format_ids = {cell_formats[0]: 0}
+
+    def style_id(font_id: int, fill_id: int = 0, border_id: int = 0, numfmt_id: int = 0, centered: bool = False) -> int:
+        key = (font_id, fill_id, border_id, numfmt_id, centered)
+        if key not in format_ids:
+            format_ids[key] = len(cell_formats)
+            cell_formats.append(key)
+        return format_ids[key]
+
+    def cell_xml(ref: str, value, s: int) -> str:
+        if value is None or value == "":
+            return f'<c r="{ref}" s="{s}"/>'
+        if isinstance(value, str):
+            return f'<c r="{ref}" s="{s}" t="inlineStr"><is><t>{xml_escape(value)}</t></is></c>'
+        return f'<c r="{ref}" s="{s}"><v>{value:.16g}</v></c>'
+
+    letters = EXCEL_COLUMN_LETTERS
+    last_letter = letters[TABLE_TOTAL_COLS - 1]
     hs_unit_label = "(ft)" if unit == 'US' else "(m)"
-    for colors in group_colors:
-        cell = ws.cell(row=row_idx, column=col_idx, value=f"Hs {hs_unit_label}")
-        cell.fill = PatternFill(start_color=colors["subheader"], end_color=colors["subheader"], fill_type="solid")
-        cell.alignment = Alignment(horizontal="center")
-        cell.font = Font(bold=True)
-        col_idx += 1
-        cell = ws.cell(row=row_idx, column=col_idx, value="Tp (s)")
-        cell.fill = PatternFill(start_color=colors["subheader"], end_color=colors["subheader"], fill_type="solid")
-        cell.alignment = Alignment(horizontal="center")
-        cell.font = Font(bold=True)
-        col_idx += 1
-        cell = ws.cell(row=row_idx, column=col_idx, value="Dir (d)")
-        cell.fill = PatternFill(start_color=colors["subheader"], end_color=colors["subheader"], fill_type="solid")
-        cell.alignment = Alignment(horizontal="center")
-        cell.font = Font(bold=True)
-        col_idx += 1
-    cell = ws.cell(row=row_idx, column=col_idx, value=f"Hs {hs_unit_label}")
-    cell.fill = PatternFill(start_color=combined_colors["subheader"], end_color=combined_colors["subheader"], fill_type="solid")
-    cell.alignment = Alignment(horizontal="center")
-    cell.font = Font(bold=True)
-    for data_row in rows:
-        row_idx += 1
-        parsed_time = None
-        try:
-            parsed_time = datetime.strptime(data_row[1], "%I:%M:%S %p").time()
-        except Exception:
-            try:
-                parsed_time = datetime.strptime(data_row[1], "%I:%M %p").time()
-            except Exception:
-                parsed_time = None
-        bold_start = datetime.strptime("6:00:00 AM", "%I:%M:%S %p").time()
-        bold_end = datetime.strptime("7:00:00 PM", "%I:%M:%S %p").time()
-        dashed_start_evening = datetime.strptime("8:00:00 PM", "%I:%M:%S %p").time()
-        dashed_end_morning = datetime.strptime("5:00:00 AM", "%I:%M:%S %p").time()
-        is_bold_row = False
-        border_style_name = None
-        if parsed_time is not None:
-            if bold_start <= parsed_time <= bold_end:
-                is_bold_row = True
-                border_style_name = "thin"
-            elif parsed_time >= dashed_start_evening or parsed_time <= dashed_end_morning:
-                is_bold_row = False
-                border_style_name = "dashed"
-        border_obj = None
-        if border_style_name:
-            border_obj = Border(
-                left=Side(style=border_style_name, color="000000"),
-                right=Side(style=border_style_name, color="000000"),
-                top=Side(style=border_style_name, color="000000"),
-                bottom=Side(style=border_style_name, color="000000"),
-            )
-        date_cell = ws.cell(row=row_idx, column=1, value=data_row[0])
-        date_cell.font = Font(bold=True)
-        if border_obj:
-            date_cell.border = border_obj
-        time_cell = ws.cell(row=row_idx, column=2, value=data_row[1])
-        time_cell.font = Font(bold=is_bold_row)
-        if border_obj:
-            time_cell.border = border_obj
-        col_idx = 3
-        data_iter = iter(data_row[2:])
-        for colors in group_colors:
-            hs_val = next(data_iter)
-            display_hs = hs_val
-            if hs_val is not None and unit != 'US':
-                display_hs = hs_val / 3.28084
-            cell = ws.cell(row=row_idx, column=col_idx, value=display_hs if display_hs is not None else "")
-            cell.fill = PatternFill(start_color=colors["data"], end_color=colors["data"], fill_type="solid")
-            cell.number_format = "0.00"
-            cell.font = Font(bold=is_bold_row)
-            if border_obj:
-                cell.border = border_obj
-            col_idx += 1
-            tp_val = next(data_iter)
-            cell = ws.cell(row=row_idx, column=col_idx, value=tp_val if tp_val is not None else "")
-            cell.fill = PatternFill(start_color=colors["data"], end_color=colors["data"], fill_type="solid")
-            cell.number_format = "0.0"
-            cell.font = Font(bold=is_bold_row)
-            if border_obj:
-                cell.border = border_obj
-            col_idx += 1
-            dir_val = next(data_iter)
-            cell = ws.cell(row=row_idx, column=col_idx, value=dir_val if dir_val is not None else "")
-            cell.fill = PatternFill(start_color=colors["data"], end_color=colors["data"], fill_type="solid")
-            cell.font = Font(bold=is_bold_row)
-            if border_obj:
-                cell.border = border_obj
+    out = [
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        f'<cols>{XLSX_COLS}</cols><sheetData>'
+    ]
+    # Omit model run row in Excel per your current requirements
+    for row_idx, text in enumerate((cycle_str, location_str, f"Time Zone: {tz_label}"), start=1):
+        out.append(f'<row r="{row_idx}">{cell_xml(f"A{row_idx}", text, style_id(1))}</row>')
+
+    header = [cell_xml("A4", "Date", style_id(1)), cell_xml("B4", "Time", style_id(1))]
+    subheader = []
+    col_idx = 2
+    for idx, colors in enumerate(SWELL_GROUP_COLORS, start=1):
+        header.append(cell_xml(f"{letters[col_idx]}4", f"Swell {idx}", style_id(2, XLSX_FILL_IDS[colors["header"]], centered=True)))
+        sub_style = style_id(1, XLSX_FILL_IDS[colors["subheader"]], centered=True)
+        for label in (f"Hs {hs_unit_label}", "Tp (s)", "Dir (d)"):
+            subheader.append(cell_xml(f"{letters[col_idx]}5", label, sub_style))
             col_idx += 1
-        combined_val = data_row[-1]
-        display_comb = combined_val
-        if combined_val is not None and unit != 'US':
-            display_comb = combined_val / 3.28084
-        cell = ws.cell(row=row_idx, column=col_idx, value=display_comb if display_comb is not None else "")
-        cell.fill = PatternFill(start_color=combined_colors["data"], end_color=combined_colors["data"], fill_type="solid")
-        cell.number_format = "0.00"
-        cell.font = Font(bold=is_bold_row)
-        if border_obj:
-            cell.border = border_obj
-    ws.column_dimensions['A'].width = 30
-    ws.column_dimensions['B'].width = 15
-    col = 3
-    for _ in range(len(group_colors) * 3 + 1):
-        letter = chr(64 + col) if col <= 26 else 'A' + chr(38 + col)  # simple extension for extra columns
-        ws.column_dimensions[letter].width = 10
-        col += 1
+    header.append(cell_xml(f"{letters[col_idx]}4", "Combined", style_id(2, XLSX_FILL_IDS[COMBINED_COLORS["header"]], centered=True)))
+    subheader.append(cell_xml(f"{letters[col_idx]}5", f"Hs {hs_unit_label}", style_id(1, XLSX_FILL_IDS[COMBINED_COLORS["subheader"]], centered=True)))
+    out.append(f'<row r="4">{"".join(header)}</row>')
+    out.append(f'<row r="5">{"".join(subheader)}</row>')
+
+    # Per-column style ids for each time band, resolved once for the whole table.
+    band_styles = {}
+    for band, border_id in XLSX_BORDER_IDS.items():
+        row_font = 1 if band == "bold" else 3
+        ids = [style_id(1, 0, border_id), style_id(row_font, 0, border_id)]
+        for colors in SWELL_GROUP_COLORS:
+            fill_id = XLSX_FILL_IDS[colors["data"]]
+            for numfmt in ("0.00", "0.0", None):
+                ids.append(style_id(row_font, fill_id, border_id, XLSX_NUMFMT_IDS[numfmt]))
+        ids.append(style_id(row_font, XLSX_FILL_IDS[COMBINED_COLORS["data"]], border_id, XLSX_NUMFMT_IDS["0.00"]))
+        band_styles[band] = ids
+
+    for row_idx, data_row in enumerate(rows, start=6):
+        ids = band_styles[time_band(data_row[1])]
+        cells = []
+        for col, value in enumerate(data_row):
+            if value is not None and unit != 'US' and col in HS_COLUMNS:
+                value = value / M_TO_FT
+            cells.append(cell_xml(f"{letters[col]}{row_idx}", value, ids[col]))
+        out.append(f'<row r="{row_idx}">{"".join(cells)}</row>')
+    out.append('</sheetData>')
+
+    merges = [f"A{row_idx}:{last_letter}{row_idx}" for row_idx in (1, 2, 3)]
+    merges += [f"{letters[col]}4:{letters[col + 2]}4" for col in range(2, 2 + len(SWELL_GROUP_COLORS) * 3, 3)]
+    out.append(f'<mergeCells count="{len(merges)}">')
+    out.extend(f'<mergeCell ref="{ref}"/>' for ref in merges)
+    out.append('</mergeCells></worksheet>')
+
     bio = BytesIO()
-    wb.save(bio)
+    with zipfile.ZipFile(bio, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zf.writestr("[Content_Types].xml", XLSX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", XLSX_ROOT_RELS)
+        zf.writestr("xl/workbook.xml", XLSX_WORKBOOK)
+        zf.writestr("xl/_rels/workbook.xml.rels", XLSX_WORKBOOK_RELS)
+        zf.writestr("xl/worksheets/sheet1.xml", "".join(out))
+        zf.writestr("xl/styles.xml", xlsx_styles_xml(cell_formats))
     bio.seek(0)
     return bio
 
 
+@ttl_cache(STATION_LIST_TTL, maxsize=1)
+def get_station_options_html() -> str:
+    """
+    Render the station dropdown's ``<option>`` tags once per station list
+    refresh instead of looping over the list in the template on every request.
+    """
+    return "".join(f'<option value="{escape(sid)}">{escape(name)}</option>' for sid, name in get_station_list())
+
+
+@lru_cache(maxsize=1)
+def get_timezone_options_html() -> str:
+    """
+    Render the ``<option>`` tags for every common timezone (fixed per process).
+    """
+    return "".join(f'<option value="{escape(tz)}">{escape(tz)}</option>' for tz in sorted(pytz.common_timezones))
+
+
+def mark_selected(options_html: str, value: str) -> str:
+    """
+    Return ``options_html`` with the option whose value is ``value`` selected.
+    """
+    if not value:
+        return options_html
+    option = f'<option value="{escape(value)}">'
+    return options_html.replace(option, option[:-1] + ' selected>', 1)
+
+
+def known_unit(unit: str | None) -> str:
+    """
+    Return the unit system a request asks for: ``"US"`` (the default) or
+    ``"Metric"`` for any other value, as used in cache keys and ETags.
+    """
+    return "US" if not unit or unit == "US" else "Metric"
+
+
 @app.route("/", methods=["GET", "POST"])
 def index():
     """
     Home route: renders map + dropdowns, fetches selected station, shows table.
     """
-    stations = get_station_list()
-    timezones = sorted(pytz.common_timezones)
     unit_options = ["US", "Metric"]
 
     selected_station = ""
@@ -865,12 +1419,12 @@ def index():
     selected_unit = "US"
     if request.method == "POST":
         selected_station = request.form.get("station") or ""
-        selected_tz = request.form.get("tz") or ""
-        selected_unit = request.form.get("unit") or "US"
+        selected_tz = known_tz_name(request.form.get("tz")) or ""
+        selected_unit = known_unit(request.form.get("unit"))
     else:
         selected_station = request.args.get("station", "")
-        selected_tz = request.args.get("tz", "")
-        selected_unit = request.args.get("unit", "US") or "US"
+        selected_tz = known_tz_name(request.args.get("tz")) or ""
+        selected_unit = known_unit(request.args.get("unit"))
 
     if not selected_station:
         selected_station = "51201"
@@ -881,65 +1435,252 @@ def index():
     selected_lat: float | None = None
     selected_lon: float | None = None
 
-    if selected_station:
-        cycle_str, location_str, model_run_str, rows, effective_tz_name, parse_error = parse_bull(selected_station, selected_tz or None)
+    # Resolve the run once for this request; the table below is then looked up
+    # by (station, run, timezone) without another discovery call.
+    date_str, run_str = get_latest_run()
+    if not date_str:
+        error = "No recent run found."
+    elif selected_station:
+        cycle_str, location_str, model_run_str, rows, effective_tz_name, parse_error = parse_bull_for_run(
+            selected_station, date_str, run_str, selected_tz or None
+        )
         error = parse_error
         if rows is not None:
             tz_label = effective_tz_name
-            table_html = build_html_table(cycle_str, location_str, model_run_str, rows, tz_label, selected_unit)
+            table_html = get_table_html(selected_station, date_str, run_str, selected_tz, selected_unit)
             coords_map = load_station_coords()
             sid_str = str(selected_station).strip()
             if sid_str in coords_map:
                 selected_lat = coords_map[sid_str]['lat']
                 selected_lon = coords_map[sid_str]['lon']
             else:
-                if location_str:
-                    m = re.search(r"\(\s*([-+]?\d+(?:\.\d+)?)\s*([NS])\s+([-+]?\d+(?:\.\d+)?)\s*([EW])\)", location_str)
-                    if m:
-                        try:
-                            lat_val = float(m.group(1))
-                            lat_dir = m.group(2).upper()
-                            lon_val = float(m.group(3))
-                            lon_dir = m.group(4).upper()
-                            selected_lat = lat_val if lat_dir == 'N' else -lat_val
-                            selected_lon = lon_val if lon_dir == 'E' else -lon_val
-                        except Exception:
-                            selected_lat = None
-                            selected_lon = None
-
-    return render_template(
+                selected_lat, selected_lon = latlon_from_location(location_str)
+
+    response = make_response(render_template(
         "index.html",
-        stations=stations,
-        selected_station=selected_station,
-        timezones=timezones,
-        selected_tz=selected_tz or tz_label,
+        station_options=mark_selected(get_station_options_html(), selected_station),
+        timezone_options=mark_selected(get_timezone_options_html(), selected_tz or tz_label),
         units=unit_options,
         selected_unit=selected_unit,
         table_html=table_html,
         error=error,
         selected_lat=selected_lat,
         selected_lon=selected_lon,
+    ))
+    if request.method == "GET":
+        # The page only changes with a new run, so browsers revalidate with
+        # the body's ETag and get an empty 304 while the run is unchanged.
+        response.add_etag(weak=True)
+        response.headers["Cache-Control"] = "private, no-cache"
+        response = response.make_conditional(request)
+    return response
+
+
+@ttl_cache(PARSED_BULL_TTL, maxsize=12, cache_if=bool)
+def get_table_html(station_id: str, date_str: str, run_str: str, tz_param: str, unit_param: str) -> str:
+    """
+    Return the rendered HTML table for one station, run, timezone and unit,
+    or an empty string if the bulletin could not be parsed.
+
+    Like the parsed rows, the markup never changes within a run, so repeat
+    page views reuse it instead of formatting every cell again.  A table can
+    be close to 1 MB, so only the few most recently viewed are kept; others
+    are re-rendered from the cached parse.
+    """
+    cycle_str, location_str, model_run_str, rows, effective_tz_name, _ = parse_bull_for_run(
+        station_id, date_str, run_str, tz_param or None
+    )
+    if rows is None:
+        return ""
+    return build_html_table(cycle_str, location_str, model_run_str, rows, effective_tz_name, unit_param)
+
+
+@ttl_cache(PARSED_BULL_TTL, maxsize=32, cache_if=lambda result: result[1] is None)
+def get_download_workbook(station_id: str, date_str: str, run_str: str, tz_param: str, unit_param: str) -> tuple[bytes | None, str | None]:
+    """
+    Return ``(xlsx_bytes, error)`` for one station, run, timezone and unit.
+
+    Workbooks are kept per run, so repeated downloads of the same table (by
+    clients without a cached copy) are served without rebuilding the file.
+    """
+    cycle_str, location_str, model_run_str, rows, effective_tz_name, error = parse_bull_for_run(
+        station_id, date_str, run_str, tz_param or None
     )
+    if rows is None:
+        return None, error
+    bio = build_excel_bytes(cycle_str, location_str, model_run_str, rows, effective_tz_name, unit_param)
+    return bio.getvalue(), None
 
 
 @app.route("/download/<station_id>")
 def download(station_id: str):
     """
     Download endpoint for Excel workbook.
+
+    The workbook only changes when a new model run is published, so it carries
+    a weak ETag derived from the station, run, timezone and units; a matching
+    ``If-None-Match`` is answered with 304 before anything is generated, and
+    other requests reuse the workbook built for the same run.
     """
-    tz_param = request.args.get("tz", "")
-    unit_param = request.args.get("unit", "US") or "US"
-    cycle_str, location_str, model_run_str, rows, effective_tz_name, error = parse_bull(station_id, tz_param or None)
-    if rows is None:
-        return f"Error: {error}", 404
-    bio = build_excel_workbook(cycle_str, location_str, model_run_str, rows, effective_tz_name, unit_param)
-    filename = f"{station_id}_table_view.xlsx"
-    return send_file(
+    tz_param = known_tz_name(request.args.get("tz")) or ""
+    unit_param = known_unit(request.args.get("unit"))
+    date_str, run_str = get_latest_run()
+    if not date_str:
+        return "Error: No recent run found.", 503
+    etag = hashlib.sha1(f"{station_id}|{date_str}{run_str}|{tz_param}|{unit_param}".encode("utf-8")).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        workbook_bytes, error = get_download_workbook(station_id, date_str, run_str, tz_param, unit_param)
+        if workbook_bytes is None:
+            return f"Error: {error}", 404
+        filename = f"{station_id}_table_view.xlsx"
+        response = send_file(
+            BytesIO(workbook_bytes),
+            as_attachment=True,
+            download_name=filename,
+            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = f"private, max-age={DOWNLOAD_MAX_AGE}"
+    return response
+
+
+@app.route("/download_batch")
+def download_batch():
+    """
+    Download the Excel workbooks of several stations as one zip archive.
+
+    ``ids`` is a comma-separated list of station IDs (at most
+    ``BATCH_MAX_STATIONS``); ``tz`` and ``unit`` apply to every workbook as in
+    ``/download``.  Bulletins are fetched and workbooks built concurrently;
+    stations without a bulletin are left out of the archive.
+    """
+    station_ids = list(dict.fromkeys(sid.strip() for sid in request.args.get("ids", "").split(",") if sid.strip()))
+    if not station_ids:
+        return "Error: No station IDs given.", 400
+    if len(station_ids) > BATCH_MAX_STATIONS:
+        return f"Error: At most {BATCH_MAX_STATIONS} stations per download.", 400
+    tz_param = known_tz_name(request.args.get("tz")) or ""
+    unit_param = known_unit(request.args.get("unit"))
+    date_str, run_str = get_latest_run()
+    if not date_str:
+        return "Error: No recent run found.", 503
+    with ThreadPoolExecutor(max_workers=min(len(station_ids), BATCH_MAX_WORKERS)) as pool:
+        results = list(pool.map(
+            lambda sid: get_download_workbook(sid, date_str, run_str, tz_param, unit_param), station_ids
+        ))
+    bio = BytesIO()
+    # The workbooks are already deflate-compressed, so they are stored as is.
+    with zipfile.ZipFile(bio, "w", zipfile.ZIP_STORED) as archive:
+        for station_id, (workbook_bytes, _) in zip(station_ids, results):
+            if workbook_bytes is not None:
+                archive.writestr(f"{station_id}_table_view.xlsx", workbook_bytes)
+        if not archive.namelist():
+            return "Error: No .bull files found for the requested stations.", 404
+    bio.seek(0)
+    response = send_file(
         bio,
         as_attachment=True,
-        download_name=filename,
-        mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        download_name=f"wave_forecasts_{date_str}{run_str}.zip",
+        mimetype="application/zip",
+    )
+    response.headers["Cache-Control"] = f"private, max-age={DOWNLOAD_MAX_AGE}"
+    return response
+
+
+def json_error(message: str, status: int):
+    """
+    Return ``{"error": message}`` as a JSON response with ``status``.
+    """
+    return app.response_class(json.dumps({"error": message}), status=status, mimetype="application/json")
+
+
+@app.route("/api/forecast/<station_id>")
+def forecast_json(station_id: str):
+    """
+    JSON endpoint returning the parsed forecast table for one station, for
+    clients that render the table themselves instead of using the HTML page.
+
+    Query parameters mirror ``/download``: ``tz`` (optional) and ``unit``
+    (``US`` for feet, anything else for metres).  Errors are returned as
+    ``{"error": message}``.
+    """
+    tz_param = known_tz_name(request.args.get("tz")) or ""
+    unit_param = known_unit(request.args.get("unit"))
+    date_str, run_str = get_latest_run()
+    if not date_str:
+        return json_error("No recent run found.", 503)
+    cycle_str, location_str, model_run_str, rows, effective_tz_name, error = parse_bull_for_run(
+        station_id, date_str, run_str, tz_param or None
     )
+    if rows is None:
+        return json_error(error, 404)
+    out_rows = rows
+    if unit_param != "US":
+        # Rows are shared cache entries; convert into copies.
+        out_rows = []
+        for row in rows:
+            row = list(row)
+            for c in HS_COLUMNS:
+                if row[c] is not None:
+                    row[c] = round(row[c] / M_TO_FT, 2)
+            out_rows.append(row)
+    hs_unit = "ft" if unit_param == "US" else "m"
+    columns = ["Date", "Time"]
+    for idx in range(1, len(SWELL_GROUP_COLORS) + 1):
+        columns += [f"Swell {idx} Hs ({hs_unit})", f"Swell {idx} Tp (s)", f"Swell {idx} Dir (d)"]
+    columns.append(f"Combined Hs ({hs_unit})")
+    payload = {
+        "station": station_id,
+        "cycle": cycle_str,
+        "location": location_str,
+        "model_run": model_run_str,
+        "tz": effective_tz_name,
+        "unit": unit_param,
+        "columns": columns,
+        "rows": out_rows,
+    }
+    response = app.response_class(json.dumps(payload, separators=(",", ":")), mimetype="application/json")
+    response.headers["Cache-Control"] = f"private, max-age={DOWNLOAD_MAX_AGE}"
+    return response
+
+
+def warm_up():
+    """
+    Build the expensive lazily-initialized state off the request path: the
+    timezone finder, the station list (including the NDBC metadata fetch) and
+    the latest-run probe, which also opens the pooled NOMADS connections.
+    """
+    for step in (get_timezone_finder, get_station_list, get_latest_run):
+        try:
+            step()
+        except Exception:
+            continue
+
+
+warm_up_started = False
+warm_up_lock = threading.Lock()
+
+
+@app.before_request
+def start_warm_up():
+    """
+    Start ``warm_up`` in a background thread on the first request a process
+    serves.
+
+    Not done at import: importing the module (scripts, the debug reloader's
+    watcher process, a gunicorn master with ``--preload``) must not open
+    connections or load timezone data that forked workers would inherit.
+    """
+    global warm_up_started
+    if warm_up_started:
+        return
+    with warm_up_lock:
+        if warm_up_started:
+            return
+        warm_up_started = True
+    threading.Thread(target=warm_up, name="wave-app-warm-up", daemon=True).start()
 
 
 if __name__ == "__main__":